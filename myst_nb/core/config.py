@@ -591,6 +591,11 @@ class NbParserConfig:
         """
         field: dc.Field = self.__dataclass_fields__[field_name]
 
+        # fast path for the common case of no cell level configuration
+        cell_meta = cell_metadata.get(self.cell_metadata_key)
+        if cell_meta is None and "render" not in cell_metadata:
+            return getattr(self, field_name)
+
         cell_key = field.metadata.get("cell_key", field.name)
 
         if (
@@ -605,8 +610,6 @@ class NbParserConfig:
                 MystNBWarnings.CELL_METADATA_KEY,
             )
             cell_meta = cell_metadata["render"]
-        else:
-            cell_meta = cell_metadata.get(self.cell_metadata_key, None)
 
         if cell_meta:
             try:
@@ -142,7 +142,7 @@ class NotebookClientBase:
 
     @property
     def nb_metadata(self) -> dict[str, Any]:
-        """Get the notebook level metadata."""
+        """Get a (dict) copy of the notebook level metadata."""
         return nb_node_to_dict(self.notebook.get("metadata", {}))
 
     def nb_source_code_lexer(self) -> str | None:
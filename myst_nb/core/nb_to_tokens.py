@@ -35,10 +35,37 @@ def notebook_to_tokens(
 
     # Parse block tokens only first, leaving inline parsing to a second phase
     # (required to collect all reference definitions, before assessing references).
+    with mdit_parser.reset_rules():
+        # enable only rules up to block, for all markdown cells
+        rules = mdit_parser.core.ruler.get_active_rules()
+        mdit_parser.core.ruler.enableOnly(rules[: rules.index("inline")])
+        block_tokens = _notebook_to_block_tokens(notebook, mdit_parser, mdit_env)
+
+    # Now all definitions have been gathered, run the inline parsing phase
+    state = StateCore("", mdit_parser, mdit_env, block_tokens)
+    with mdit_parser.reset_rules():
+        rules = mdit_parser.core.ruler.get_active_rules()
+        mdit_parser.core.ruler.enableOnly(rules[rules.index("inline") :])
+        mdit_parser.core.process(state)
+
+    return state.tokens
+
+
+def _notebook_to_block_tokens(
+    notebook: NotebookNode,
+    mdit_parser: MarkdownIt,
+    mdit_env: dict[str, Any],
+) -> list[Token]:
+    """Parse the notebook cells to block-level markdown-it tokens.
+
+    The parser should be restricted to block-level rules before calling this.
+    """
     block_tokens = [Token("nb_initialise", "", 0, map=[0, 0])]
+    smap = notebook.metadata.get("source_map", None)
     for cell_index, nb_cell in enumerate(notebook.cells):
+        source = nb_cell["source"]
         # skip empty cells
-        if len(nb_cell["source"].strip()) == 0:
+        if not source.strip():
             continue
 
         # skip cells tagged for removal
@@ -61,14 +88,10 @@ def notebook_to_tokens(
                         "index": cell_index,
                         "metadata": nb_node_to_dict(nb_cell["metadata"]),
                     },
-                    map=[0, len(nb_cell["source"].splitlines()) - 1],
+                    map=[0, len(source.splitlines()) - 1],
                 ),
             ]
-            with mdit_parser.reset_rules():
-                # enable only rules up to block
-                rules = mdit_parser.core.ruler.get_active_rules()
-                mdit_parser.core.ruler.enableOnly(rules[: rules.index("inline")])
-                tokens.extend(mdit_parser.parse(nb_cell["source"], mdit_env))
+            tokens.extend(mdit_parser.parse(source, mdit_env))
             tokens.append(
                 Token(
                     "nb_cell_markdown_close",
@@ -84,7 +107,7 @@ def notebook_to_tokens(
                     "nb_cell_raw",
                     "code",
                     0,
-                    content=nb_cell["source"],
+                    content=source,
                     meta={
                         "index": cell_index,
                         "metadata": nb_node_to_dict(nb_cell["metadata"]),
@@ -102,7 +125,7 @@ def notebook_to_tokens(
                     "nb_cell_code",
                     "code",
                     0,
-                    content=nb_cell["source"],
+                    content=source,
                     meta={
                         "index": cell_index,
                         "metadata": nb_node_to_dict(nb_cell["metadata"]),
@@ -115,7 +138,6 @@ def notebook_to_tokens(
 
         # update token's source lines, using either a source_map (index -> line),
         # set when converting to a notebook, or a pseudo base of the cell index
-        smap = notebook.metadata.get("source_map", None)
         start_line = smap[cell_index] if smap else (cell_index + 1) * 10000
         start_line += 1  # use base 1 rather than 0
         for token in tokens:
@@ -135,11 +157,4 @@ def notebook_to_tokens(
 
     block_tokens.append(Token("nb_finalise", "", 0, map=[0, 0]))
 
-    # Now all definitions have been gathered, run the inline parsing phase
-    state = StateCore("", mdit_parser, mdit_env, block_tokens)
-    with mdit_parser.reset_rules():
-        rules = mdit_parser.core.ruler.get_active_rules()
-        mdit_parser.core.ruler.enableOnly(rules[rules.index("inline") :])
-        mdit_parser.core.process(state)
-
-    return state.tokens
+    return block_tokens
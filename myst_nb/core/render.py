@@ -45,6 +45,8 @@ WIDGET_STATE_MIMETYPE = "application/vnd.jupyter.widget-state+json"
 WIDGET_VIEW_MIMETYPE = "application/vnd.jupyter.widget-view+json"
 RENDER_ENTRY_GROUP = "myst_nb.renderers"
 MIME_RENDER_ENTRY_GROUP = "myst_nb.mime_renderers"
+NB_SPECIAL_METADATA_KEYS = ("kernelspec", "language_info", "source_map")
+"""Notebook metadata keys that are stored separately, rather than as docinfo."""
 _ANSI_RE = re.compile("\x1b\\[(.*?)([@-~])")
 _QUOTED_RE = re.compile(r"^([\"']).*\1$")
 
@@ -129,37 +131,24 @@ class MditRenderMixin:
         """Render a notebook code cell."""
         cell_index = token.meta["index"]
         cell_line = token_line(token, 0) or None
-        tags = token.meta["metadata"].get("tags", [])
+        metadata = token.meta["metadata"]
+        tags = metadata.get("tags", [])
 
         exec_count, outputs = self._get_nb_code_cell_outputs(token)
 
-        classes = ["cell"]
-        for tag in tags:
-            classes.append(f"tag_{tag.replace(' ', '_')}")
-
-        # TODO do we need this -/_ duplication of tag names, or can we deprecate one?
-        hide_cell = "hide-cell" in tags
-        remove_input = (
-            self.get_cell_level_config(
-                "remove_code_source", token.meta["metadata"], line=cell_line
-            )
-            or ("remove_input" in tags)
-            or ("remove-input" in tags)
+        remove_input, remove_output = self._get_nb_cell_remove_flags(
+            metadata, tags, cell_line
         )
-        hide_input = "hide-input" in tags
-        remove_output = (
-            self.get_cell_level_config(
-                "remove_code_outputs", token.meta["metadata"], line=cell_line
-            )
-            or ("remove_output" in tags)
-            or ("remove-output" in tags)
-        )
-        hide_output = "hide-output" in tags
-
         # if we are remove both the input and output, we can skip the cell
         if remove_input and remove_output:
             return
 
+        # note, docutils expects a (mutable) list of classes
+        classes = list(cell_tag_classes(tuple(tags)))
+        hide_cell = "hide-cell" in tags
+        hide_input = "hide-input" in tags
+        hide_output = "hide-output" in tags
+
         hide_mode = None
         if hide_cell:
             hide_mode = "all"
@@ -176,16 +165,16 @@ class MditRenderMixin:
             cell_index=cell_index,
             # TODO some way to use this to allow repr of count in outputs like HTML?
             exec_count=exec_count,
-            cell_metadata=token.meta["metadata"],
+            cell_metadata=metadata,
             classes=classes,
         )
         if hide_mode:
             cell_container["hide_mode"] = hide_mode
             code_prompt_show = self.get_cell_level_config(
-                "code_prompt_show", token.meta["metadata"], line=cell_line
+                "code_prompt_show", metadata, line=cell_line
             )
             code_prompt_hide = self.get_cell_level_config(
-                "code_prompt_hide", token.meta["metadata"], line=cell_line
+                "code_prompt_hide", metadata, line=cell_line
             )
             cell_container["prompt_show"] = code_prompt_show
             cell_container["prompt_hide"] = code_prompt_hide
@@ -210,6 +199,29 @@ class MditRenderMixin:
                 with self.current_node_context(cell_output, append=True):
                     self._render_nb_cell_code_outputs(token, outputs)
 
+    def _get_nb_cell_remove_flags(
+        self: SelfType,
+        cell_metadata: dict[str, Any],
+        tags: list[str],
+        line: int | None = None,
+    ) -> tuple[bool, bool]:
+        """Get whether to remove the source and/or outputs of a code cell.
+
+        :returns: a tuple of (remove_input, remove_output)
+        """
+        # TODO do we need this -/_ duplication of tag names, or can we deprecate one?
+        remove_input = (
+            self.get_cell_level_config("remove_code_source", cell_metadata, line=line)
+            or ("remove_input" in tags)
+            or ("remove-input" in tags)
+        )
+        remove_output = (
+            self.get_cell_level_config("remove_code_outputs", cell_metadata, line=line)
+            or ("remove_output" in tags)
+            or ("remove-output" in tags)
+        )
+        return remove_input, remove_output
+
     def _get_nb_source_code_lexer(
         self: SelfType,
         cell_index: int,
@@ -255,10 +267,13 @@ class MditRenderMixin:
     ) -> tuple[int | None, list[NotebookNode]]:
         """Get the outputs for a code cell and its execution count."""
         cell_index = token.meta["index"]
-        line = token_line(token, 0) or None
 
         exec_count, outputs = self.nb_client.code_cell_outputs(cell_index)
+        if not outputs:
+            # no need to resolve the merge_streams config, if there is nothing to merge
+            return exec_count, outputs
 
+        line = token_line(token, 0) or None
         if self.get_cell_level_config("merge_streams", token.meta["metadata"], line):
             # TODO should this be saved on the output notebook
             outputs = coalesce_streams(outputs)
@@ -367,7 +382,7 @@ class NbElementRenderer:
 
         :param path: the path to write the file to, relative to the output folder
         :param content: the content to write to the file
-        :param overwrite: whether to overwrite an existing file
+        :param overwrite: whether to overwrite an existing file (if its content differs)
         :param exists_ok: whether to ignore an existing file if overwrite is False
 
         :returns: URI to use for referencing the file
@@ -378,7 +393,9 @@ class NbElementRenderer:
             pass  # do not output anything if output_folder is not set (docutils only)
         elif filepath.exists():
             if overwrite:
-                filepath.write_bytes(content)
+                # avoid re-writing unchanged files, so that their mtime is preserved
+                if filepath.read_bytes() != content:
+                    filepath.write_bytes(content)
             elif not exists_ok:
                 # TODO raise or just report?
                 raise FileExistsError(f"File already exists: {filepath}")
@@ -911,6 +928,15 @@ def load_mime_renders() -> list[MimeRenderPlugin]:
     return [ep.load() for ep in all_eps.get(MIME_RENDER_ENTRY_GROUP, [])]  # type: ignore
 
 
+@lru_cache
+def cell_tag_classes(tags: tuple[str, ...]) -> tuple[str, ...]:
+    """Get the classes for a code cell container, from its tags.
+
+    This is cached, since many cells in a notebook often share the same tags.
+    """
+    return ("cell", *(f"tag_{tag.replace(' ', '_')}" for tag in tags))
+
+
 def strip_ansi(text: str) -> str:
     """Strip ANSI escape sequences from a string"""
     return _ANSI_RE.sub("", text)
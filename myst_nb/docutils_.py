@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from functools import lru_cache, partial
+from functools import cached_property, lru_cache, partial
 from importlib import resources as import_resources
 import os
 from typing import Any
@@ -34,6 +34,7 @@ from myst_nb.core.read import (
     standard_nb_read,
 )
 from myst_nb.core.render import (
+    NB_SPECIAL_METADATA_KEYS,
     MditRenderMixin,
     MimeData,
     NbElementRenderer,
@@ -45,8 +46,8 @@ from myst_nb.ext.eval import load_eval_docutils
 from myst_nb.ext.glue import load_glue_docutils
 from myst_nb.warnings_ import MystNBWarnings, create_warning
 
-DOCUTILS_EXCLUDED_ARGS = list(
-    {f.name for f in NbParserConfig.get_fields() if f.metadata.get("docutils_exclude")}
+DOCUTILS_EXCLUDED_ARGS = tuple(
+    f.name for f in NbParserConfig.get_fields() if "docutils_exclude" in f.metadata
 )
 
 
@@ -56,6 +57,19 @@ class DocutilsApp:
     directives: dict[str, Any] = field(default_factory=dict)
 
 
+@lru_cache(maxsize=1)
+def _get_mystnb_css() -> bytes:
+    """Get the content of the myst-nb CSS stylesheet."""
+    return (import_resources.files(static) / "mystnb.css").read_bytes()
+
+
+@lru_cache(maxsize=1)
+def _get_pygments_css() -> bytes:
+    """Get the content of the pygments CSS stylesheet."""
+    fmt = get_formatter_by_name("html", style="default")
+    return fmt.get_style_defs(".code").encode("utf-8")
+
+
 @lru_cache(maxsize=1)
 def get_nb_roles_directives() -> DocutilsApp:
     app = DocutilsApp()
@@ -186,6 +200,8 @@ class Parser(MystParser):
 
         # open the notebook execution client,
         # this may execute the notebook immediately or during the page render
+        # (note, this is not overlapped with the token parsing in a thread,
+        # since clients update the notebook in-place and log to the document)
         with create_client(notebook, document_source, nb_config, logger) as nb_client:
             mdit_parser.options["nb_client"] = nb_client
             # convert to docutils AST, which is added to the document
@@ -206,17 +222,12 @@ class Parser(MystParser):
 
                 css_paths.append(
                     nb_renderer.write_file(
-                        ["mystnb.css"],
-                        (import_resources.files(static) / "mystnb.css").read_bytes(),
-                        overwrite=True,
+                        ["mystnb.css"], _get_mystnb_css(), overwrite=True
                     )
                 )
-                fmt = get_formatter_by_name("html", style="default")
                 css_paths.append(
                     nb_renderer.write_file(
-                        ["pygments.css"],
-                        fmt.get_style_defs(".code").encode("utf-8"),
-                        overwrite=True,
+                        ["pygments.css"], _get_pygments_css(), overwrite=True
                     )
                 )
                 css_paths = [os.path.abspath(path) for path in css_paths]
@@ -235,25 +246,35 @@ class Parser(MystParser):
 class DocutilsNbRenderer(DocutilsRenderer, MditRenderMixin):
     """A docutils-only renderer for Jupyter Notebooks."""
 
+    @cached_property
+    def _mime_rank(self) -> dict[str, int]:
+        """Mapping of mime type -> priority rank (lowest is preferred).
+
+        This is constant for the whole document, so it is only computed once.
+        """
+        mime_priority = get_mime_priority(
+            self.nb_config.builder_name, self.nb_config.mime_priority_overrides
+        )
+        return {mime_type: rank for rank, mime_type in enumerate(mime_priority)}
+
     def render_nb_initialise(self, token: SyntaxTreeNode) -> None:
+        # note, this is a copy, so we can pop keys from it
         metadata = self.nb_client.nb_metadata
-        special_keys = ["kernelspec", "language_info", "source_map"]
-        for key in special_keys:
+        for key in NB_SPECIAL_METADATA_KEYS:
             # save these special keys on the document, rather than as docinfo
             if key in metadata:
-                self.document[f"nb_{key}"] = metadata.get(key)
+                self.document[f"nb_{key}"] = metadata.pop(key)
 
         if self.nb_config.metadata_to_fm:
             # forward the remaining metadata to the front_matter renderer
-            special_keys.append("widgets")
-            top_matter = {k: v for k, v in metadata.items() if k not in special_keys}
+            metadata.pop("widgets", None)
             self.render_front_matter(
                 Token(  # type: ignore
                     "front_matter",
                     "",
                     0,
                     map=[0, 0],
-                    content=top_matter,  # type: ignore[arg-type]
+                    content=metadata,  # type: ignore[arg-type]
                 ),
             )
 
@@ -264,41 +285,44 @@ class DocutilsNbRenderer(DocutilsRenderer, MditRenderMixin):
         cell_index = token.meta["index"]
         metadata = token.meta["metadata"]
         line = token_line(token)
+        mime_rank = self._mime_rank
         # render the outputs
-        mime_priority = get_mime_priority(
-            self.nb_config.builder_name, self.nb_config.mime_priority_overrides
-        )
         for output_index, output in enumerate(outputs):
-            if output.output_type == "stream":
-                if output.name == "stdout":
+            output_type = output["output_type"]
+            if output_type == "stream":
+                stream_name = output["name"]
+                if stream_name == "stdout":
                     _nodes = self.nb_renderer.render_stdout(
                         output, metadata, cell_index, line
                     )
-                    self.add_line_and_source_path_r(_nodes, token)
+                    self._annotate_nodes(_nodes, line)
                     self.current_node.extend(_nodes)
-                elif output.name == "stderr":
+                elif stream_name == "stderr":
                     _nodes = self.nb_renderer.render_stderr(
                         output, metadata, cell_index, line
                     )
-                    self.add_line_and_source_path_r(_nodes, token)
+                    self._annotate_nodes(_nodes, line)
                     self.current_node.extend(_nodes)
                 else:
                     pass  # TODO warning
-            elif output.output_type == "error":
+            elif output_type == "error":
                 _nodes = self.nb_renderer.render_error(
                     output, metadata, cell_index, line
                 )
-                self.add_line_and_source_path_r(_nodes, token)
+                self._annotate_nodes(_nodes, line)
                 self.current_node.extend(_nodes)
-            elif output.output_type in ("display_data", "execute_result"):
+            elif output_type in ("display_data", "execute_result"):
                 # Note, this is different to the sphinx implementation,
                 # here we directly select a single output, based on the mime_priority,
                 # as opposed to output all mime types, and select in a post-transform
                 # (the mime_priority must then be set for the output format)
 
-                try:
-                    mime_type = next(x for x in mime_priority if x in output["data"])
-                except StopIteration:
+                mime_type = min(
+                    (x for x in output["data"] if x in mime_rank),
+                    key=mime_rank.__getitem__,
+                    default=None,
+                )
+                if mime_type is None:
                     if output["data"]:
                         create_warning(
                             self.document,
@@ -330,17 +354,30 @@ class DocutilsNbRenderer(DocutilsRenderer, MditRenderMixin):
                             ),
                         )
                         self.current_node.extend(_nodes)
-                        self.add_line_and_source_path_r(_nodes, token)
+                        self._annotate_nodes(_nodes, line)
             else:
                 create_warning(
                     self.document,
-                    f"Unsupported output type: {output.output_type}",
+                    f"Unsupported output type: {output_type}",
                     line=line,
                     append_to=self.current_node,
                     # wtype=DEFAULT_LOG_TYPE,
                     subtype=MystNBWarnings.OUTPUT_TYPE,
                 )
 
+    def _annotate_nodes(self, _nodes: list[nodes.Element], line: int) -> None:
+        """Set the line number and document source path on the nodes,
+        and recursively on all their descendants.
+
+        This is equivalent to ``add_line_and_source_path_r``,
+        but with the line resolved once per cell, rather than per node.
+        """
+        source = self.document["source"]
+        for node in _nodes:
+            for child in findall(node)():
+                child.line = line
+                child.source = source
+
 
 def _run_cli(
     writer_name: str, builder_name: str, writer_description: str, argv: list[str] | None
@@ -31,6 +31,7 @@ from myst_nb.core.loggers import DEFAULT_LOG_TYPE, SphinxDocLogger
 from myst_nb.core.nb_to_tokens import nb_node_to_dict, notebook_to_tokens
 from myst_nb.core.read import create_nb_reader
 from myst_nb.core.render import (
+    NB_SPECIAL_METADATA_KEYS,
     MditRenderMixin,
     MimeData,
     NbElementRenderer,
@@ -212,24 +213,23 @@ class SphinxNbRenderer(SphinxRenderer, MditRenderMixin):
 
     def render_nb_initialise(self, token: SyntaxTreeNode) -> None:
         env = cast(BuildEnvironment, self.sphinx_env)
+        # note, this is a copy, so we can pop keys from it
         metadata = self.nb_client.nb_metadata
-        special_keys = ["kernelspec", "language_info", "source_map"]
-        for key in special_keys:
+        for key in NB_SPECIAL_METADATA_KEYS:
             if key in metadata:
                 # save these special keys on the metadata, rather than as docinfo
                 # note, sphinx_book_theme checks kernelspec is in the metadata
-                env.metadata[env.docname][key] = metadata.get(key)
+                env.metadata[env.docname][key] = metadata.pop(key)
 
         # forward the remaining metadata to the front_matter renderer
-        special_keys.append("widgets")
-        top_matter = {k: v for k, v in metadata.items() if k not in special_keys}
+        metadata.pop("widgets", None)
         self.render_front_matter(
             Token(  # type: ignore
                 "front_matter",
                 "",
                 0,
                 map=[0, 0],
-                content=top_matter,  # type: ignore[arg-type]
+                content=metadata,  # type: ignore[arg-type]
             ),
         )
 
@@ -242,14 +242,16 @@ class SphinxNbRenderer(SphinxRenderer, MditRenderMixin):
         metadata = token.meta["metadata"]
         # render the outputs
         for output_index, output in enumerate(outputs):
-            if output.output_type == "stream":
-                if output.name == "stdout":
+            output_type = output["output_type"]
+            if output_type == "stream":
+                stream_name = output["name"]
+                if stream_name == "stdout":
                     _nodes = self.nb_renderer.render_stdout(
                         output, metadata, cell_index, line
                     )
                     self.add_line_and_source_path_r(_nodes, token)
                     self.current_node.extend(_nodes)
-                elif output.name == "stderr":
+                elif stream_name == "stderr":
                     _nodes = self.nb_renderer.render_stderr(
                         output, metadata, cell_index, line
                     )
@@ -257,13 +259,13 @@ class SphinxNbRenderer(SphinxRenderer, MditRenderMixin):
                     self.current_node.extend(_nodes)
                 else:
                     pass  # TODO warning
-            elif output.output_type == "error":
+            elif output_type == "error":
                 _nodes = self.nb_renderer.render_error(
                     output, metadata, cell_index, line
                 )
                 self.add_line_and_source_path_r(_nodes, token)
                 self.current_node.extend(_nodes)
-            elif output.output_type in ("display_data", "execute_result"):
+            elif output_type in ("display_data", "execute_result"):
                 # Note, this is different to the docutils implementation,
                 # where we directly select a single output, based on the mime_priority.
                 # Here, we do not know the mime priority until we know the output format
@@ -305,7 +307,7 @@ class SphinxNbRenderer(SphinxRenderer, MditRenderMixin):
             else:
                 create_warning(
                     self.document,
-                    f"Unsupported output type: {output.output_type}",
+                    f"Unsupported output type: {output_type}",
                     line=line,
                     append_to=self.current_node,
                     # wtype=DEFAULT_LOG_TYPE,
@@ -1,6 +1,7 @@
 """Run parsing tests against the docutils parser."""
 from io import StringIO
 import json
+import os
 from pathlib import Path
 
 from docutils.core import publish_doctree, publish_string
@@ -81,3 +82,21 @@ def test_html_resources(tmp_path):
     assert "pygments.css" in result
     assert tmp_path.joinpath("mystnb.css").is_file()
     assert tmp_path.joinpath("pygments.css").is_file()
+
+
+def test_unchanged_outputs_not_rewritten(tmp_path):
+    """Test that unchanged output files are not re-written on a re-parse."""
+    source = json.dumps(
+        {"cells": [], "metadata": {}, "nbformat": 4, "nbformat_minor": 4}
+    )
+    settings = {
+        "nb_execution_mode": "off",
+        "nb_output_folder": str(tmp_path),
+        "warning_stream": StringIO(),
+    }
+    publish_doctree(source, parser=Parser(), settings_overrides=settings)
+    output_path = tmp_path.joinpath("processed.ipynb")
+    assert output_path.is_file()
+    os.utime(output_path, (0, 0))
+    publish_doctree(source, parser=Parser(), settings_overrides=settings)
+    assert output_path.stat().st_mtime == 0